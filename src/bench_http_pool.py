@@ -0,0 +1,106 @@
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from llm_registry import build_chat_model, chat_model, new_http_client
+
+REQUESTS = 50
+API_VERSION = "2024-02-01"
+DEPLOYMENT = "bench"
+
+COMPLETION = json.dumps({
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": DEPLOYMENT,
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}).encode()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingHTTPServer(ThreadingHTTPServer):
+    """Counts accepted connections; each one costs a TLS handshake."""
+
+    connections = 0
+
+    def get_request(self):
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+
+def start_mock_server(workdir):
+    cert = os.path.join(workdir, "cert.pem")
+    key = os.path.join(workdir, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", key, "-out", cert, "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True, capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+
+    server = CountingHTTPServer(("127.0.0.1", 0), CompletionHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, cert
+
+
+def timed(server, invoke):
+    server.connections = 0
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        invoke()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    mean = sum(latencies) / len(latencies)
+    return mean, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)], server.connections
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        server, cert = start_mock_server(workdir)
+        os.environ["SSL_CERT_FILE"] = cert
+
+        params = {
+            "azure_deployment": DEPLOYMENT,
+            "api_version": API_VERSION,
+            "api_key": "bench",
+            "azure_endpoint": f"https://localhost:{server.server_address[1]}",
+        }
+
+        # Both models are built once; only the connection handling differs.
+        without_reuse = build_chat_model(new_http_client(keepalive=False), **params)
+        shared_pool = chat_model(**params)
+
+        print(f"{'mode':<14} {'mean':>9} {'p50':>9} {'p95':>9} {'handshakes':>11}")
+        for name, llm in (("no keep-alive", without_reuse), ("shared pool", shared_pool)):
+            mean, p50, p95, connections = timed(server, lambda: llm.invoke("ping"))
+            print(f"{name:<14} {mean * 1000:>7.2f}ms {p50 * 1000:>7.2f}ms {p95 * 1000:>7.2f}ms {connections:>11}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import tiktoken
+from qa_sql import DB_PATH, describe_schema, get_schema_info, query_db
+
+STEPS = 10
+
+QUERIES = [
+    "SELECT COUNT(*) AS total FROM languages",
+    "SELECT name, year_created FROM languages ORDER BY year_created LIMIT 3",
+    "SELECT name FROM frameworks WHERE language_id = 1",
+    "SELECT l.name, COUNT(f.id) AS frameworks FROM languages l LEFT JOIN frameworks f ON f.language_id = l.id GROUP BY l.name LIMIT 3",
+    "SELECT name, popularity FROM libraries ORDER BY popularity DESC LIMIT 3",
+    "SELECT creator FROM languages WHERE name = 'Python'",
+    "SELECT COUNT(*) AS total FROM libraries",
+    "SELECT name FROM frameworks WHERE year_created > 2010",
+    "SELECT name FROM missing_table",
+    "SELECT l.name, lib.name FROM libraries lib JOIN languages l ON l.id = lib.language_id LIMIT 3",
+]
+
+encoding = tiktoken.get_encoding("cl100k_base")
+
+
+def full_schema_query(query):
+    """query_db as it was: the reflected schema attached to the first row or to the error."""
+    schema_info = {
+        table: {key: info[key] for key in ("columns", "primary_keys", "foreign_keys")}
+        for table, info in get_schema_info(DB_PATH).items()
+    }
+    results = query_db(query)
+    results[0].pop("_schema")
+    results[0]["_schema_info"] = schema_info
+    return results
+
+
+def scratchpad_growth(steps):
+    scratchpad = ""
+    sizes = []
+    for tool, tool_input, func in steps:
+        observation = func(tool_input)
+        scratchpad += f"Action: {tool}\nAction Input: {tool_input}\nObservation: {observation}\nThought: "
+        sizes.append(len(encoding.encode(scratchpad)))
+    return sizes
+
+
+def main():
+    before = scratchpad_growth([("query", query, full_schema_query) for query in QUERIES[:STEPS]])
+    after = scratchpad_growth(
+        [("describe_schema", "", describe_schema)]
+        + [("query", query, query_db) for query in QUERIES[:STEPS - 1]]
+    )
+
+    print(f"{'step':>4} {'before':>8} {'after':>8}")
+    for step, (old, new) in enumerate(zip(before, after), start=1):
+        print(f"{step:>4} {old:>8} {new:>8}")
+    print(f"per-step growth: before {before[-1] / STEPS:.0f} tokens, after {after[-1] / STEPS:.0f} tokens")
+
+
+if __name__ == "__main__":
+    main()
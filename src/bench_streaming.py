@@ -0,0 +1,76 @@
+import time
+from langchain.agents import initialize_agent, AgentType
+from langchain.tools import Tool
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from streaming import stream_answer
+
+TOKEN_DELAY = 0.01
+TOOL_DELAY = 0.5
+RUNS = 3
+
+RESPONSES = [
+    "Thought: I need to query the database.\n"
+    "Action: query\n"
+    "Action Input: SELECT COUNT(*) FROM customers",
+    "Thought: I now know the final answer.\n"
+    "Final Answer: There are 42 customers registered in the database, "
+    "most of them located in the southern region.",
+]
+
+
+class FakeStreamingChatModel(FakeListChatModel):
+    """FakeListChatModel whose blocking call pays the same per-character delay as its stream."""
+
+    def _call(self, *args, **kwargs):
+        response = super()._call(*args, **kwargs)
+        time.sleep(len(response) * (self.sleep or 0))
+        return response
+
+
+def fake_query(query):
+    time.sleep(TOOL_DELAY)
+    return [{"count": 42}]
+
+
+def build_agent():
+    llm = FakeStreamingChatModel(responses=RESPONSES, sleep=TOKEN_DELAY)
+    tool = Tool(name="query", func=fake_query, description="Run SQL queries and return results")
+    return initialize_agent(
+        agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+        tools=[tool],
+        llm=llm,
+        handle_parsing_errors=True,
+    )
+
+
+def blocking_run():
+    agent = build_agent()
+    start = time.perf_counter()
+    agent.invoke({"input": "How many customers do we have?"})
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed, elapsed
+
+
+def streaming_run():
+    agent = build_agent()
+    start = time.perf_counter()
+    first_event = first_token = None
+    for event in stream_answer(agent, {"input": "How many customers do we have?"}):
+        now = time.perf_counter() - start
+        if first_event is None:
+            first_event = now
+        if event["event"] == "token" and first_token is None:
+            first_token = now
+    return first_event, first_token, time.perf_counter() - start
+
+
+def main():
+    print(f"{'mode':<10} {'first byte':>12} {'first token':>12} {'total':>10}")
+    for name, run in (("blocking", blocking_run), ("streaming", streaming_run)):
+        timings = [run() for _ in range(RUNS)]
+        first_event, first_token, total = (sum(t) / RUNS for t in zip(*timings))
+        print(f"{name:<10} {first_event:>11.3f}s {first_token:>11.3f}s {total:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from langchain.agents import initialize_agent, AgentType
 from langchain.tools import Tool
 from credentials_llm import AZURE
-from qa_sql import query_db
+from qa_sql import query_db, describe_schema, DESCRIBE_SCHEMA_DESCRIPTION
+from streaming import print_answer
 
 tool = Tool(
     name="query",
@@ -9,9 +10,15 @@ tool = Tool(
     description="Run SQL queries and return results"
 )
 
+schema_tool = Tool(
+    name="describe_schema",
+    func=describe_schema,
+    description=DESCRIBE_SCHEMA_DESCRIPTION
+)
+
 agent = initialize_agent(
     agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-    tools=[tool],
+    tools=[tool, schema_tool],
     llm=AZURE,
     handle_parsing_errors=True,
     verbose=True
@@ -20,8 +27,7 @@ agent = initialize_agent(
 def main():
     query = input("How can I help you? ").strip()
     try:
-        result = agent.invoke({"input": query})
-        print(f"LLM output: {result['output']}")
+        print_answer(agent, {"input": query})
     except Exception as e:
         print(f"Error: {e}")
 
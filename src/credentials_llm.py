@@ -1,16 +1,11 @@
 import os
 import dotenv
-from langchain_openai import AzureChatOpenAI
 from langchain_groq import ChatGroq
+from llm_registry import azure_chat
 
 dotenv.load_dotenv()
 
-AZURE = AzureChatOpenAI(
-    azure_deployment=os.getenv("AZURE_DEPLOYMENT"),
-    api_version=os.getenv("AZURE_API_VERSION"),
-    api_key=os.getenv("AZURE_API_KEY"),
-    azure_endpoint=os.getenv("AZURE_ENDPOINT"),
-)
+AZURE = azure_chat()
 
 GROQ = ChatGroq(
     model_name=os.getenv("GROQ_MODEL_NAME"),
@@ -1,8 +1,8 @@
 from crewai import Agent, Task, Crew, Process
 from langchain.tools import Tool
 
-from credentials_llm import AZURE
-from qa_sql import query_db
+from llm_registry import azure_chat
+from qa_sql import query_db, describe_schema, DESCRIBE_SCHEMA_DESCRIPTION
 
 tool = Tool(
     name="SQL Query Tool",
@@ -10,20 +10,26 @@ tool = Tool(
     description="Execute SQLite queries and return results"
 )
 
+schema_tool = Tool(
+    name="Describe Schema Tool",
+    func=describe_schema,
+    description=DESCRIBE_SCHEMA_DESCRIPTION
+)
+
 agent = Agent(
     role="Database Specialist",
     goal="Execute SQL queries and provide database information",
     backstory="Database specialist executing SQL queries and providing database information",
-    tools=[tool],
+    tools=[tool, schema_tool],
     verbose=True,
     allow_delegation=True,
-    llm=AZURE
+    llm=azure_chat()
 )
 
 task = Task(
     description="Execute an SQL query",
     expected_output="SQL query results",
-    tools=[tool],
+    tools=[tool, schema_tool],
     agent=agent
 )
 
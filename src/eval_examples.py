@@ -0,0 +1,48 @@
+import json
+import sys
+from example_store import ExampleStore
+from sql_chat import run_query_sql
+
+
+def load_questions(path):
+    questions = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            questions.append(json.loads(line)["question"] if line.startswith("{") else line)
+    return questions
+
+
+def replay(questions, examples):
+    attempts = [run_query_sql(question, examples)[1] for question in questions]
+    retries = sum(count - 1 for count in attempts)
+    retried = sum(1 for count in attempts if count > 1)
+    return retries, retried / len(attempts)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python3 src/eval_examples.py <question_log.jsonl>")
+        sys.exit(1)
+
+    questions = load_questions(sys.argv[1])
+    if not questions:
+        print(f"No questions found in {sys.argv[1]}.")
+        print("Usage: python3 src/eval_examples.py <question_log.jsonl>")
+        sys.exit(1)
+
+    baseline_retries, baseline_rate = replay(questions, None)
+    few_shot_retries, few_shot_rate = replay(questions, ExampleStore(path=None))
+
+    print(f"questions replayed: {len(questions)}")
+    print(f"{'mode':<10} {'retries':>8} {'retry rate':>11}")
+    print(f"{'baseline':<10} {baseline_retries:>8} {baseline_rate:>10.1%}")
+    print(f"{'few-shot':<10} {few_shot_retries:>8} {few_shot_rate:>10.1%}")
+    if baseline_rate:
+        print(f"retry-rate reduction: {1 - few_shot_rate / baseline_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+import numpy as np
+from qa_sql import get_schema_info, schema_hash
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'data/examples')
+MAX_EXAMPLES = int(os.getenv("EXAMPLES_MAX_SIZE", "500"))
+FEATURE_DIM = 2 ** 12
+NGRAM = 3
+
+_lock = threading.Lock()
+_stores = {}
+
+
+def _words(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def _features(text, dim=FEATURE_DIM):
+    """Hashed bag of words and character n-grams, L2-normalised."""
+    vector = np.zeros(dim, dtype=np.float32)
+    for word in _words(text):
+        tokens = [word]
+        padded = f"#{word}#"
+        tokens += [padded[i:i + NGRAM] for i in range(max(len(padded) - NGRAM + 1, 1))]
+        for token in tokens:
+            vector[zlib.crc32(token.encode()) % dim] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class ExampleStore:
+    """Verified question/SQL pairs with a cosine-similarity index for few-shot prompts.
+
+    The store keeps at most max_size examples. When full, unconfirmed examples are
+    evicted before confirmed ones, least recently used first.
+    """
+
+    def __init__(self, path=None, max_size=MAX_EXAMPLES, dim=FEATURE_DIM):
+        self.path = path
+        self.max_size = max_size
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._examples = []
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._load()
+
+    def __len__(self):
+        return len(self._examples)
+
+    def add(self, question, sql, confirmed=False):
+        """Record a question/SQL pair that executed successfully."""
+        key = " ".join(_words(question))
+        with self._lock:
+            for example in self._examples:
+                if example["key"] == key:
+                    example.update(sql=sql, confirmed=example["confirmed"] or confirmed, last_used=time.time())
+                    break
+            else:
+                self._examples.append({
+                    "key": key,
+                    "question": question,
+                    "sql": sql,
+                    "confirmed": confirmed,
+                    "last_used": time.time(),
+                })
+                self._vectors = np.vstack([self._vectors, _features(question, self.dim)])
+                self._evict()
+            self._save()
+
+    def confirm(self, question):
+        """Mark the stored example for question as confirmed by the user."""
+        key = " ".join(_words(question))
+        with self._lock:
+            for example in self._examples:
+                if example["key"] == key:
+                    example["confirmed"] = True
+                    self._save()
+                    return True
+        return False
+
+    def similar(self, question, k=3, min_score=0.3):
+        """Return up to k stored examples most similar to question, best first."""
+        with self._lock:
+            if not self._examples:
+                return []
+            scores = self._vectors @ _features(question, self.dim)
+            best = np.argsort(-scores)[:k]
+            matches = []
+            for index in best:
+                if scores[index] < min_score:
+                    break
+                example = self._examples[index]
+                example["last_used"] = time.time()
+                matches.append(example)
+            return matches
+
+    def _evict(self):
+        while len(self._examples) > self.max_size:
+            index = min(
+                range(len(self._examples)),
+                key=lambda i: (self._examples[i]["confirmed"], self._examples[i]["last_used"]),
+            )
+            del self._examples[index]
+            self._vectors = np.delete(self._vectors, index, axis=0)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            data = []
+        if not isinstance(data, list):
+            data = []
+        required = ("key", "question", "sql", "confirmed", "last_used")
+        self._examples = [example for example in data if isinstance(example, dict) and all(k in example for k in required)]
+        if self._examples:
+            self._vectors = np.vstack([_features(example["question"], self.dim) for example in self._examples])
+        self._evict()
+
+    def _save(self):
+        """Write to a temporary file and swap it in, so a crash never leaves a truncated store."""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as file:
+            json.dump(self._examples, file, ensure_ascii=False, indent=2)
+        os.replace(file.name, self.path)
+
+
+def get_store(path):
+    """Process-wide ExampleStore for path."""
+    with _lock:
+        if path not in _stores:
+            _stores[path] = ExampleStore(path)
+        return _stores[path]
+
+
+def database_store(db_path):
+    """ExampleStore for the schema of db_path, or None when the schema cannot be read.
+
+    Examples are only valid for the schema they were recorded against, so each
+    schema gets its own file and databases with identical schemas share one.
+    """
+    digest = schema_hash(get_schema_info(db_path))
+    if digest is None:
+        return None
+    return get_store(os.path.join(EXAMPLES_DIR, f"{digest}.json"))
+
+
+def format_examples(examples):
+    return "\n\n".join(f"Question: {example['question']}\nSQL: {example['sql']}" for example in examples)
@@ -0,0 +1,179 @@
+import asyncio
+import importlib.util
+import os
+import socket
+import threading
+import weakref
+import dotenv
+import httpx
+import openai
+from langchain_openai import AzureChatOpenAI
+
+dotenv.load_dotenv()
+
+MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "10"))
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+AZURE_PARAMS = {
+    "azure_deployment": os.getenv("AZURE_DEPLOYMENT"),
+    "api_version": os.getenv("AZURE_API_VERSION"),
+    "api_key": os.getenv("AZURE_API_KEY"),
+    "azure_endpoint": os.getenv("AZURE_ENDPOINT"),
+}
+
+_lock = threading.Lock()
+_http_client = None
+_http_async_client = None
+
+
+def _transport_options(keepalive=True):
+    return {
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS if keepalive else 0,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        "http2": HTTP2,
+        "socket_options": [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+    }
+
+
+def _timeout():
+    return httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT)
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per event loop.
+
+    Pooled connections belong to the loop that opened them, so callers awaiting
+    from different loops (the streaming loop, an HTTP server, asyncio.run) each
+    get their own pool instead of sharing sockets across loops. A loop's pool is
+    closed by loop.shutdown_asyncgens(), which asyncio.run calls on exit. Code
+    that manages its own loop must await loop.shutdown_asyncgens() before
+    loop.close(), otherwise that loop's pool stays open for the process lifetime.
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._transports = weakref.WeakKeyDictionary()
+
+    async def _close_on_shutdown(self, loop_ref, transport):
+        try:
+            yield
+        finally:
+            loop = loop_ref()
+            if loop is not None:
+                self._transports.pop(loop, None)
+            await transport.aclose()
+
+    async def _transport(self):
+        loop = asyncio.get_running_loop()
+        entry = self._transports.get(loop)
+        if entry is None:
+            transport = httpx.AsyncHTTPTransport(**self._options)
+            closer = self._close_on_shutdown(weakref.ref(loop), transport)
+            await closer.__anext__()
+            entry = self._transports[loop] = (transport, closer)
+        return entry[0]
+
+    async def handle_async_request(self, request):
+        transport = await self._transport()
+        return await transport.handle_async_request(request)
+
+    async def aclose(self):
+        entry = self._transports.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+def new_http_client(keepalive=True):
+    """A tuned httpx client; most callers want the shared get_http_client() instead."""
+    return httpx.Client(transport=httpx.HTTPTransport(**_transport_options(keepalive)), timeout=_timeout())
+
+
+def new_http_async_client():
+    return httpx.AsyncClient(transport=_PerLoopTransport(**_transport_options()), timeout=_timeout())
+
+
+def get_http_client():
+    """Process-wide httpx client shared by every chat model."""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = new_http_client()
+        return _http_client
+
+
+def get_http_async_client():
+    """Process-wide async httpx client shared by every chat model, pooled per event loop."""
+    global _http_async_client
+    with _lock:
+        if _http_async_client is None:
+            _http_async_client = new_http_async_client()
+        return _http_async_client
+
+
+def _supports_shared_clients():
+    fields = getattr(AzureChatOpenAI, "model_fields", None) or AzureChatOpenAI.__fields__
+    return "http_async_client" in fields
+
+
+def _secret(value):
+    return value.get_secret_value() if hasattr(value, "get_secret_value") else value
+
+
+def _attach_clients(model, http_client, http_async_client):
+    """Rebuild the OpenAI clients of model on top of the given httpx clients.
+
+    Older langchain-openai releases hand a single http_client to both the sync and
+    async OpenAI clients, which the async client rejects, so the clients are
+    replaced after construction using the settings the model resolved.
+    """
+    params = {
+        "api_version": model.openai_api_version,
+        "azure_endpoint": model.azure_endpoint,
+        "azure_deployment": model.deployment_name,
+        "api_key": _secret(model.openai_api_key),
+        "azure_ad_token": _secret(model.azure_ad_token),
+        "azure_ad_token_provider": model.azure_ad_token_provider,
+        "organization": model.openai_organization,
+        "base_url": model.openai_api_base,
+        "max_retries": model.max_retries,
+        "default_headers": model.default_headers,
+        "default_query": model.default_query,
+    }
+    if model.request_timeout is not None:
+        params["timeout"] = model.request_timeout
+    model.client = openai.AzureOpenAI(**params, http_client=http_client).chat.completions
+    if http_async_client is not None:
+        model.async_client = openai.AsyncAzureOpenAI(**params, http_client=http_async_client).chat.completions
+    return model
+
+
+def build_chat_model(http_client, http_async_client=None, **params):
+    """Construct an AzureChatOpenAI that sends its requests through the given httpx clients."""
+    if _supports_shared_clients():
+        clients = {"http_client": http_client}
+        if http_async_client is not None:
+            clients["http_async_client"] = http_async_client
+        return AzureChatOpenAI(**params, **clients)
+    return _attach_clients(AzureChatOpenAI(**params), http_client, http_async_client)
+
+
+def chat_model(**params):
+    """Return a new AzureChatOpenAI for params that sends its requests through the shared httpx clients.
+
+    Only the connection pool is shared: each caller gets its own model, so
+    per-model state such as callbacks (crewai attaches token counters) does not
+    leak between modules.
+    """
+    return build_chat_model(get_http_client(), get_http_async_client(), **params)
+
+
+def azure_chat(**overrides):
+    """Chat model for the default AZURE_* credentials."""
+    return chat_model(**{**AZURE_PARAMS, **overrides})
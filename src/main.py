@@ -1,4 +1,5 @@
 from crew_sql_chat import agent_executor
+from streaming import print_answer
 
 def main():
     while True:
@@ -6,8 +7,8 @@ def main():
         if user_query == 'exit':
             break
 
-        response = agent_executor.invoke({"input": user_query})
-        print(("output:", response['output']) if 'output' in response else "No valid output received.")
+        if not print_answer(agent_executor, {"input": user_query}, prefix="output: "):
+            print("No valid output received.")
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,21 @@
+import hashlib
 import os
 import sqlite3
+from functools import lru_cache
 from sqlalchemy import create_engine, inspect
 
-def query_db(query):
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data/temp.db')
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'data/temp.db')
+DESCRIBE_SCHEMA_DESCRIPTION = (
+    "Without input, list tables with columns, primary keys (*) and foreign keys (→). "
+    "With comma-separated table names, show column types and constraints for those tables."
+)
+
+def query_db(query, db_path=DB_PATH):
     query = query.strip()
-    schema_info = get_schema_info(db_path)
+    fingerprint = schema_fingerprint(get_schema_info(db_path))
 
     if not query.lower().startswith(('select', 'show', 'with')):
-        return [{"Error": f"Invalid query. Only SELECT queries allowed.", "Schema": schema_info}]
+        return [{"Error": f"Invalid query. Only SELECT queries allowed.", "_schema": fingerprint}]
 
     try:
         connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
@@ -25,23 +32,100 @@ def query_db(query):
         connection.close()
 
         if formatted_results:
-            formatted_results[0]["_schema_info"] = schema_info
+            formatted_results[0]["_schema"] = fingerprint
         else:
-            formatted_results = [{"_schema_info": schema_info, "message": "Query executed successfully, but returned no results."}]
-        print("\nSchema: ", formatted_results)
+            formatted_results = [{"_schema": fingerprint, "message": "Query executed successfully, but returned no results."}]
+        print("\nResults: ", formatted_results)
         return formatted_results
     except sqlite3.OperationalError as e:
         if "readonly database" in str(e).lower():
-            return [{"error": "Security Error: Attempt to modify database detected.", "_schema_info": schema_info}]
-        return [{"error": f"Database error: {str(e)}", "_schema_info": schema_info}]
+            return [{"error": "Security Error: Attempt to modify database detected.", "_schema": fingerprint}]
+        return [{"error": f"Database error: {str(e)}", "_schema": fingerprint}]
     except Exception as e:
-        return [{"error": f"Execution error: {str(e)}", "_schema_info": schema_info}]
+        return [{"error": f"Execution error: {str(e)}", "_schema": fingerprint}]
+
+
+def describe_schema(tables="", db_path=DB_PATH):
+    """Schema on demand: a compact digest of every table, or full detail for the named tables."""
+    schema_info = get_schema_info(db_path)
+    if not all(isinstance(info, dict) for info in schema_info.values()):
+        return schema_info
+
+    requested = [table.strip().strip("'\"") for table in tables.split(",")]
+    requested = [table for table in requested if table and table.lower() not in ("none", "all", "*")]
+    if not requested:
+        return schema_digest(schema_info)
+
+    details = []
+    for table in requested:
+        if table not in schema_info:
+            details.append(f"{table}: unknown table. Known tables: {', '.join(schema_info)}")
+        else:
+            details.append(table_detail(table, schema_info[table]))
+    return "\n\n".join(details)
+
+
+def schema_digest(schema_info):
+    """One line per table: primary keys marked with *, foreign keys as column→table.column."""
+    lines = []
+    for table, info in schema_info.items():
+        references = _references(info)
+        columns = []
+        for column in info["columns"]:
+            name = f"{column}*" if column in info["primary_keys"] else column
+            if column in references:
+                name = f"{name}→{references[column]}"
+            columns.append(name)
+        lines.append(f"{table}: {', '.join(columns)}")
+    return "\n".join(lines)
+
+
+def table_detail(table, info):
+    references = _references(info)
+    lines = [table]
+    for column in info["columns"]:
+        line = f"  {column} {info['column_types'].get(column, '')}".rstrip()
+        if column in info["primary_keys"]:
+            line += " PRIMARY KEY"
+        if column in info["not_null"]:
+            line += " NOT NULL"
+        if column in references:
+            line += f" → {references[column]}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def schema_hash(schema_info):
+    """Eight hex digits identifying the schema, or None when it could not be reflected."""
+    if not all(isinstance(info, dict) for info in schema_info.values()):
+        return None
+    return hashlib.sha1(schema_digest(schema_info).encode()).hexdigest()[:8]
+
+
+def schema_fingerprint(schema_info):
+    """Short stand-in for the schema in tool results; changes whenever the schema does."""
+    digest = schema_hash(schema_info)
+    if digest is None:
+        return next(iter(schema_info.values()), "Schema unavailable.")
+    return f"{len(schema_info)} tables, schema {digest}. Use describe_schema for table details."
+
+
+def _references(info):
+    references = {}
+    for foreign_key in info["foreign_keys"]:
+        for column, referred in zip(foreign_key["constrained_columns"], foreign_key["referred_columns"]):
+            references[column] = f"{foreign_key['referred_table']}.{referred}"
+    return references
 
 
 def get_schema_info(db_path):
     if not os.path.exists(db_path):
         return {"Error": "Database file not found."}
+    return _reflect_schema(os.path.abspath(db_path), os.path.getmtime(db_path))
+
 
+@lru_cache(maxsize=8)
+def _reflect_schema(db_path, mtime):
     try:
         engine = create_engine(f"sqlite:///{db_path}")
         inspector = inspect(engine)
@@ -55,9 +139,12 @@ def get_schema_info(db_path):
             columns = inspector.get_columns(table)
             schema_info[table] = {
                 "columns": [column['name'] for column in columns],
+                "column_types": {column['name']: str(column['type']) for column in columns},
+                "not_null": [column['name'] for column in columns if not column.get('nullable', True)],
                 "primary_keys": inspector.get_pk_constraint(table)['constrained_columns'],
                 "foreign_keys": inspector.get_foreign_keys(table)
             }
+        engine.dispose()
         return schema_info
     except Exception as e:
         return {"error": f"Schema extraction error: {str(e)}."}
@@ -1,11 +1,12 @@
 import logging
-import os
 import re
 import sqlite3
 import dotenv
 from langchain.agents import initialize_agent, AgentType
-from langchain_openai import AzureChatOpenAI
 from langchain.tools import Tool
+from llm_registry import azure_chat
+from example_store import database_store, format_examples
+from streaming import print_answer
 
 dotenv.load_dotenv()
 DB_PATH = "data/temp.db"
@@ -16,12 +17,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-llm = AzureChatOpenAI(
-    azure_deployment=os.getenv("AZURE_DEPLOYMENT"),
-    api_version=os.getenv("AZURE_API_VERSION"),
-    api_key=os.getenv("AZURE_API_KEY"),
-    azure_endpoint=os.getenv("AZURE_ENDPOINT"),
-)
+llm = azure_chat()
+_answered = []
 
 
 def get_metadata(db_path):
@@ -56,6 +53,16 @@ def get_metadata(db_path):
 
 
 def query_sql(user_query):
+    return run_query_sql(user_query, database_store(DB_PATH))[0]
+
+
+def run_query_sql(user_query, examples=None):
+    """Answer user_query with generated SQL and return (answer, attempts).
+
+    Similar verified questions from examples are injected as few-shot demonstrations,
+    and queries that return results are recorded back into it until the user
+    confirms them through confirm_answers().
+    """
     metadata, sample_data = get_metadata(DB_PATH)
 
     schema_info = "\n".join(
@@ -68,11 +75,15 @@ def query_sql(user_query):
         for table, samples in sample_data.items() if samples
     )
 
+    similar = examples.similar(user_query) if examples is not None else []
+    examples_info = f"Verified examples of similar questions:\n{format_examples(similar)}" if similar else ""
+
     planning_prompt = f"""
     You are an expert in SQLite and I need your help. Below is the schema of the database and some sample data.
 
     Database Schema: {schema_info}
     Sample Data: {sample_info}
+    {examples_info}
 
     The user's question is: "{user_query}"
 
@@ -85,6 +96,7 @@ def query_sql(user_query):
         sql_prompt = f"""
         Database Schema: {schema_info}
         Sample Data: {sample_info}
+        {examples_info}
 
         Your plan: {plan}
 
@@ -122,17 +134,20 @@ def query_sql(user_query):
                 final_answer += "<<<END_SQL_RESULTS>>>\n"
                 final_answer += "IMPORTANT: Your final answer MUST include ALL fields shown above in EXACTLY the same format and order.\n"
 
-                return final_answer
+                if examples is not None:
+                    examples.add(user_query, sql_query)
+                    _answered.append((examples, user_query))
+                return final_answer, attempt + 1
 
         except Exception as e:
             logger.error(f"SQL query execution failed: {e}")
             if attempt < 4:
                 logger.info("Attempting an alternative query...")
             else:
-                return "Could not execute query. Check you answer and try again."
+                return "Could not execute query. Check you answer and try again.", attempt + 1
             continue
 
-    return "Could not execute the query after multiple attempts."
+    return "Could not execute the query after multiple attempts.", 3
 
 
 def clear_query(query):
@@ -156,3 +171,29 @@ agent_executor = initialize_agent(
     verbose=True
 )
 
+
+def confirm_answers(correct):
+    """Confirm or discard the examples recorded while answering the last question."""
+    while _answered:
+        examples, question = _answered.pop()
+        if correct:
+            examples.confirm(question)
+
+
+def main():
+    while True:
+        user_query = input("How can I help you? ")
+        if user_query == 'exit':
+            break
+
+        _answered.clear()
+        if not print_answer(agent_executor, {"input": user_query}, prefix="output: "):
+            print("No valid output received.")
+            continue
+        if _answered:
+            confirm_answers(input("Was this answer correct? (y/n) ").strip().lower().startswith("y"))
+
+
+if __name__ == "__main__":
+    main()
+
@@ -1,4 +1,3 @@
-from operator import itemgetter
 import os
 import dotenv
 from langchain.agents import AgentExecutor, tool
@@ -12,8 +11,8 @@ from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_core.prompts.chat import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables import RunnablePassthrough
-from langchain_openai import AzureChatOpenAI
+from llm_registry import chat_model
+from example_store import database_store, format_examples
 import dotenv
 
 dotenv.load_dotenv()
@@ -32,11 +31,13 @@ def sql_to_llm_tool(uuid: str, question: str, table_columns_desc: str, metadata:
 
 
 class QA_SQL:
-    def __init__(self, sqlite_path: str, question: str, template: str, metadata: dict | None = None):
+    def __init__(self, sqlite_path: str, question: str, template: str, metadata: dict | None = None, examples=None, confirmed: bool = False):
         self.__sqlite_path = sqlite_path
         self.__question = question
         self.__template = template
         self.__metadata = metadata or {}
+        self.__examples = examples if examples is not None else database_store(sqlite_path)
+        self.__confirmed = confirmed
 
     def extract_schema_and_query_llm(self):
 
@@ -49,7 +50,7 @@ class QA_SQL:
         if not all([api_key, azure_deployment, api_version, azure_endpoint]):
             raise ValueError("Certifique-se de que todas as credenciais do Azure OpenAI estão definidas no arquivo .env.")
 
-        llm = AzureChatOpenAI(
+        llm = chat_model(
             azure_deployment=azure_deployment,
             api_version=api_version,
             api_key=api_key,
@@ -60,12 +61,16 @@ class QA_SQL:
 
         write_query = create_sql_query_chain(llm, db)
         execute_query = QuerySQLDataBaseTool(db=db)
-        write_execute_chain = write_query | execute_query
-        
+        similar = self.__examples.similar(self.__question) if self.__examples is not None else []
+        few_shot = f" | verified examples of similar questions:\n{format_examples(similar)}\n" if similar else ""
+
         try:
-            result = write_execute_chain.invoke({
-                "question": f"{self.__template} | do not limit the query: {self.__question}"
+            query = write_query.invoke({
+                "question": f"{self.__template}{few_shot} | do not limit the query: {self.__question}"
             })
+            result = execute_query.invoke(query)
+            if self.__examples is not None and result and not str(result).startswith("Error"):
+                self.__examples.add(self.__question, query, confirmed=self.__confirmed)
             
             answer_prompt = PromptTemplate.from_template(
                 """Given the following user question, corresponding SQL query, 
@@ -79,14 +84,10 @@ class QA_SQL:
             )
             
             answer = answer_prompt | llm | StrOutputParser()
-            chain = RunnablePassthrough.assign(
-                query=write_query
-            ).assign(
-                result=itemgetter("query") | execute_query
-            ) | answer
-            
-            response = chain.invoke({
+            response = answer.invoke({
                 "question": f"{self.__template} | de acordo com '{self.__question}' gerar uma mensagem amigavel",
+                "query": query,
+                "result": result,
                 "metadata": self.__metadata
             })
             return response
@@ -139,7 +140,7 @@ sql_to_llm_tool_ = StructuredTool(
     args_schema=SQLToolInput
 )
 
-llm = AzureChatOpenAI(
+llm = chat_model(
     openai_api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
     model_name=os.getenv("AZURE_OPENAI_DEPLOYMENT"),
     temperature=0.0,
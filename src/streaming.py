@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import queue
+import threading
+from langchain_core.callbacks import BaseCallbackHandler
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+STEP_LABELS = {
+    "query": "running SQL…",
+    "sql_query": "running SQL…",
+    "SQLQueryTool": "running SQL…",
+    "SQL Query Tool": "running SQL…",
+    "describe_schema": "reading schema…",
+    "Describe Schema Tool": "reading schema…",
+}
+
+_DONE = object()
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop():
+    """One long-lived event loop, so pooled async HTTP connections are reused between calls."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+        return _loop
+
+
+class StreamCancelled(Exception):
+    """Raised inside an agent run whose stream consumer has gone away."""
+
+
+class _IgnoreStreamCancelled(logging.Filter):
+    """Drops the callback manager's warning for the StreamCancelled used to stop a run."""
+
+    def filter(self, record):
+        return "StreamCancelled()" not in record.getMessage()
+
+
+logging.getLogger("langchain_core.callbacks.manager").addFilter(_IgnoreStreamCancelled())
+
+
+class _StopWhenCancelled(BaseCallbackHandler):
+    """Aborts the agent at its next chain, LLM or tool step once stopped is set.
+
+    Cancelling the stream task alone is not enough: astream_events waits for the
+    underlying run to finish before propagating the cancellation.
+    """
+
+    raise_error = True
+
+    def __init__(self, stopped):
+        self.stopped = stopped
+
+    def _check(self, *args, **kwargs):
+        if self.stopped.is_set():
+            raise StreamCancelled()
+
+    on_chain_start = on_llm_start = on_chat_model_start = on_tool_start = _check
+
+
+def step_label(tool_name):
+    return STEP_LABELS.get(tool_name, f"running {tool_name}…")
+
+
+def _chunk_text(chunk):
+    if isinstance(chunk, str):
+        return chunk
+    content = getattr(chunk, "content", None)
+    if isinstance(content, str):
+        return content
+    return getattr(chunk, "text", "") or ""
+
+
+async def astream_answer(agent, inputs, config=None):
+    """Stream an agent run as step markers and final-answer tokens.
+
+    Yields dicts of the form {"event": "step" | "token" | "end", "data": str}.
+    Tokens produced while a tool is running, ReAct reasoning before the
+    "Final Answer:" marker, and internal tools such as the parsing-error
+    "_Exception" retry are not forwarded.
+    """
+    root_run_id = None
+    tool_depth = 0
+    buffers = {}
+    streamed = False
+
+    async for event in agent.astream_events(inputs, config, version="v1"):
+        kind = event["event"]
+        run_id = event["run_id"]
+        if root_run_id is None:
+            root_run_id = run_id
+
+        if kind == "on_tool_start":
+            tool_depth += 1
+            if not event["name"].startswith("_"):
+                yield {"event": "step", "data": step_label(event["name"])}
+        elif kind == "on_tool_end":
+            tool_depth = max(tool_depth - 1, 0)
+        elif kind in ("on_chat_model_start", "on_llm_start"):
+            buffers[run_id] = ""
+        elif kind in ("on_chat_model_stream", "on_llm_stream") and not tool_depth:
+            text = _chunk_text(event["data"].get("chunk"))
+            buffer = buffers.get(run_id, "")
+            if buffer is None:
+                text = text if streamed else text.lstrip()
+                if text:
+                    streamed = True
+                    yield {"event": "token", "data": text}
+                continue
+            buffer += text
+            if FINAL_ANSWER_MARKER in buffer:
+                buffers[run_id] = None
+                answer = buffer.split(FINAL_ANSWER_MARKER, 1)[1].lstrip()
+                if answer:
+                    streamed = True
+                    yield {"event": "token", "data": answer}
+            else:
+                buffers[run_id] = buffer
+        elif kind == "on_chain_end" and run_id == root_run_id:
+            output = event["data"].get("output") or {}
+            if isinstance(output, dict):
+                output = output.get("output", "")
+            if not streamed and output:
+                yield {"event": "token", "data": str(output)}
+            yield {"event": "end", "data": str(output)}
+
+
+def stream_answer(agent, inputs):
+    """Synchronous view of astream_answer for the CLI and queue consumers.
+
+    Closing the generator early cancels the agent run on the background loop.
+    """
+    events = queue.Queue()
+    stopped = threading.Event()
+    config = {"callbacks": [_StopWhenCancelled(stopped)]}
+
+    async def produce():
+        try:
+            async for event in astream_answer(agent, inputs, config):
+                events.put(event)
+        except StreamCancelled:
+            pass
+        except Exception as e:
+            events.put(e)
+        finally:
+            events.put(_DONE)
+
+    future = asyncio.run_coroutine_threadsafe(produce(), _background_loop())
+
+    try:
+        while True:
+            event = events.get()
+            if event is _DONE:
+                break
+            if isinstance(event, Exception):
+                raise event
+            yield event
+        future.result()
+    finally:
+        stopped.set()
+        future.cancel()
+
+
+def print_answer(agent, inputs, prefix="LLM output: "):
+    """Print step markers and stream the final answer to stdout."""
+    answering = False
+    for event in stream_answer(agent, inputs):
+        if event["event"] == "step":
+            print(f"[{event['data']}]", flush=True)
+        elif event["event"] == "token":
+            if not answering:
+                print(prefix, end="", flush=True)
+                answering = True
+            print(event["data"], end="", flush=True)
+    if answering:
+        print()
+    return answering
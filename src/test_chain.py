@@ -1,9 +1,9 @@
-import os
 import sqlite3
 from langchain.agents import Tool, AgentType, initialize_agent
 from langchain_core.pydantic_v1 import BaseModel, Field
-from sqlalchemy import create_engine, inspect
 from credentials_llm import AZURE
+from qa_sql import describe_schema, get_schema_info, schema_fingerprint, DESCRIBE_SCHEMA_DESCRIPTION
+from streaming import print_answer
 import dotenv
 
 dotenv.load_dotenv()
@@ -19,7 +19,7 @@ def sql_query_func(query):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    metadata = None
+    fingerprint = schema_fingerprint(get_schema_info(db_path))
     try:
         cursor.execute(query)
         column_names = [description[0] for description in cursor.description]
@@ -29,46 +29,19 @@ def sql_query_func(query):
         for row in results:
             formatted_row = {column_names[i]: row[i] for i in range(len(column_names))}
             formatted_results.append(formatted_row)
-        metadata = get_schema_info(db_path)
 
         if formatted_results:
-            formatted_results[0]["_metadata"] = metadata
+            formatted_results[0]["_schema"] = fingerprint
         else:
-            formatted_results = [{"_metadata": metadata, "message": "Query executed successfully, but returned no results."}]
+            formatted_results = [{"_schema": fingerprint, "message": "Query executed successfully, but returned no results."}]
         return formatted_results
 
     except sqlite3.Error as e:
-        return [{"error": f"Database error: {str(e)}", "_metadata": metadata}]
+        return [{"error": f"Database error: {str(e)}", "_schema": fingerprint}]
     finally:
         conn.close()
 
 
-def get_schema_info(db_path):
-    if not os.path.exists(db_path):
-        return {"Error": "Database file not found."}
-
-    try:
-        engine = create_engine(f"sqlite:///{db_path}")
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-
-        if not tables:
-            return {"Error": "No tables found in database."}
-
-        schema_info = {}
-        for table in tables:
-            columns = inspector.get_columns(table)
-            schema_info[table] = {
-                "columns": [column['name'] for column in columns],
-                "primary_keys": inspector.get_pk_constraint(table)['constrained_columns'],
-                "foreign_keys": inspector.get_foreign_keys(table)
-            }
-        return schema_info
-    except Exception as e:
-        return {"error": f"Schema extraction error: {str(e)}."}
-
-
-
 sql_tool = Tool(
     name="sql_query",
     func=sql_query_func,
@@ -76,10 +49,16 @@ sql_tool = Tool(
     args_schema=QueryArgsClass
 )
 
+schema_tool = Tool(
+    name="describe_schema",
+    func=lambda tables="": describe_schema(tables, "data/temp.db"),
+    description=DESCRIBE_SCHEMA_DESCRIPTION
+)
+
 
 agent = initialize_agent(
     agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-    tools=[sql_tool],
+    tools=[sql_tool, schema_tool],
     llm=AZURE,
     handle_parsing_errors=True,
     verbose=True
@@ -89,8 +68,7 @@ agent = initialize_agent(
 def main():
     query = input("How can I help you? ").strip()
     try:
-        result = agent.invoke({"input": query})
-        print(f"LLM output: {result['output']}")
+        print_answer(agent, {"input": query})
     except Exception as e:
         print(f"Error: {e}")
 